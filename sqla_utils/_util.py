@@ -0,0 +1,18 @@
+"""Internal helpers shared between modules."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+
+
+@lru_cache(maxsize=512)
+def cached_text(query: str) -> TextClause:
+    """Return a cached text clause for a query string.
+
+    Text clauses are immutable, so they can be shared. This saves parsing
+    the bind parameters of frequently used queries again.
+    """
+    return text(query)
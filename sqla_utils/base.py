@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, TypeVar
+from collections.abc import Iterable
+from typing import Any, ClassVar, TypeVar
 from uuid import UUID
 
-from sqlalchemy import Table
+from sqlalchemy import Table, func
 from sqlalchemy.orm import Query, declarative_base
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import BooleanClauseList
 
 from .exc import UnknownItemError
 from .transaction import Transaction
@@ -24,6 +27,16 @@ class DBObjectBase(_DeclarativeBase):  # type: ignore
     __abstract__ = True
     __tablename__: str
     __table__: Table
+    _item_type: ClassVar[str | None] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, "__tablename__"):
+            cls._item_type = cls.__tablename__
+        elif hasattr(cls, "__table__"):
+            cls._item_type = cls.__table__.name
+        else:
+            cls._item_type = None
 
     @classmethod
     def item_type(cls) -> str:
@@ -32,12 +45,9 @@ class DBObjectBase(_DeclarativeBase):  # type: ignore
         Used for describing exceptions. Can be overriden by sub-classes.
         Defaults to the table name.
         """
-        if hasattr(cls, "__tablename__"):
-            return cls.__tablename__
-        elif hasattr(cls, "__table__"):
-            return cls.__table__.name
-        else:
+        if cls._item_type is None:
             raise RuntimeError(f"{cls!r} missing __table__ and __tablename__")
+        return cls._item_type
 
     @classmethod
     def query(
@@ -63,7 +73,22 @@ class DBObjectBase(_DeclarativeBase):  # type: ignore
         Return the total number of entries if no filter condition
         is specified.
         """
-        return cls.query(t, *conditions).count()
+        # Replace the columns of the query's statement, instead of using
+        # Query.count(), which wraps the query in a subquery. Building on
+        # query() keeps filters added by sub-classes. This only works if
+        # the override doesn't add clauses that change the number of rows,
+        # like LIMIT, DISTINCT, or a UNION.
+        query = cls.query(t, *conditions)
+        query_stmt = query.statement
+        if not isinstance(query_stmt, Select) or not _is_entity_select(
+            t, cls, query_stmt
+        ):
+            return query.count()
+        stmt = query_stmt.with_only_columns(
+            func.count(), maintain_column_froms=True
+        ).order_by(None)
+        count: int = t.session.execute(stmt).scalar_one()
+        return count
 
     @classmethod
     def first(
@@ -146,6 +171,55 @@ class DBObjectBase(_DeclarativeBase):  # type: ignore
             t, cls._uuid == str(uuid), field="uuid", value=uuid
         )
 
+    @classmethod
+    def fetch_many_by_ids(
+        cls: type[_DB], t: Transaction, ids: Iterable[int]
+    ) -> dict[int, _DB]:
+        """Return the database entries with the given ids.
+
+        All entries are fetched using a single query. Return a dictionary,
+        mapping the ids to the entries. Ids without a matching entry are
+        missing from the dictionary, no UnknownItemError is raised.
+
+        For this method to work, the database table needs to have a
+        numeric column named "id".
+        """
+        entries = cls.fetch_all(t, cls.id.in_(list(ids)))
+        return {o.id: o for o in entries}
+
+    @classmethod
+    def fetch_many_by_tags(
+        cls: type[_DB], t: Transaction, tags: Iterable[str]
+    ) -> dict[str, _DB]:
+        """Return the database entries with the given tags.
+
+        All entries are fetched using a single query. Return a dictionary,
+        mapping the tags to the entries. Tags without a matching entry are
+        missing from the dictionary, no UnknownItemError is raised.
+
+        For this method to work, the database table needs to have a
+        string "tag" column.
+        """
+        entries = cls.fetch_all(t, cls.tag.in_(list(tags)))
+        return {o.tag: o for o in entries}
+
+    @classmethod
+    def fetch_many_by_uuids(
+        cls: type[_DB], t: Transaction, uuids: Iterable[UUID]
+    ) -> dict[UUID, _DB]:
+        """Return the database entries with the given UUIDs.
+
+        All entries are fetched using a single query. Return a dictionary,
+        mapping the UUIDs to the entries. UUIDs without a matching entry are
+        missing from the dictionary, no UnknownItemError is raised.
+
+        For this method to work, the database table needs to have a
+        string "uuid" column.
+        """
+        uuid_strs = {str(u): u for u in uuids}
+        entries = cls.fetch_all(t, cls._uuid.in_(list(uuid_strs)))
+        return {uuid_strs.get(o._uuid) or UUID(o._uuid): o for o in entries}
+
     @classmethod
     def delete_all(cls, t: Transaction, *conditions: Any) -> None:
         """Delete all entries that match certain conditions.
@@ -156,17 +230,23 @@ class DBObjectBase(_DeclarativeBase):  # type: ignore
 
     @classmethod
     def delete_one(
-        cls, t: Transaction, *conditions: Any, check_existence: bool = True
+        cls,
+        t: Transaction,
+        *conditions: Any,
+        check_existence: bool = True,
+        field: str | None = None,
+        value: Any = None,
     ) -> None:
         """Delete an entry that matches certain conditions.
 
         If the database contains multiple entries that match the given
         conditions, delete an arbitrary entry. If it contains no matching
-        entries, raise a UnknownItemError.
+        entries, raise a UnknownItemError. field and value are only used to
+        describe the UnknownItemError.
         """
-        if check_existence:
-            cls.fetch_one(t, *conditions)
-        cls.query(t, *conditions).delete()
+        deleted = cls.query(t, *conditions).delete()
+        if check_existence and deleted == 0:
+            raise UnknownItemError(cls.item_type(), field, value)
 
     @classmethod
     def delete_by_id(
@@ -179,9 +259,13 @@ class DBObjectBase(_DeclarativeBase):  # type: ignore
         For this method to work, the database table needs to have a
         numeric column named "id".
         """
-        if check_existence:
-            cls.fetch_by_id(t, id)
-        cls.query(t, cls.id == id).delete()
+        cls.delete_one(
+            t,
+            cls.id == id,
+            check_existence=check_existence,
+            field="id",
+            value=id,
+        )
 
     @classmethod
     def delete_by_tag(
@@ -194,9 +278,13 @@ class DBObjectBase(_DeclarativeBase):  # type: ignore
         For this method to work, the database table needs to have a
         string column named "tag".
         """
-        if check_existence:
-            cls.fetch_by_tag(t, tag)
-        cls.query(t, cls.tag == tag).delete()
+        cls.delete_one(
+            t,
+            cls.tag == tag,
+            check_existence=check_existence,
+            field="tag",
+            value=tag,
+        )
 
     @classmethod
     def delete_by_uuid(
@@ -209,10 +297,65 @@ class DBObjectBase(_DeclarativeBase):  # type: ignore
         For this method to work, the database table needs to have a
         numeric column named "uuid".
         """
-        if check_existence:
-            cls.fetch_by_uuid(t, uuid)
-        cls.query(t, cls._uuid == str(uuid)).delete()
+        cls.delete_one(
+            t,
+            cls._uuid == str(uuid),
+            check_existence=check_existence,
+            field="uuid",
+            value=uuid,
+        )
+
+    @classmethod
+    def delete_many_by_ids(cls, t: Transaction, ids: Iterable[int]) -> None:
+        """Delete the entries with the given ids using a single statement.
+
+        Ids without a matching entry are ignored.
+
+        For this method to work, the database table needs to have a
+        numeric column named "id".
+        """
+        cls.delete_all(t, cls.id.in_(list(ids)))
+
+    @classmethod
+    def delete_many_by_tags(cls, t: Transaction, tags: Iterable[str]) -> None:
+        """Delete the entries with the given tags using a single statement.
+
+        Tags without a matching entry are ignored.
+
+        For this method to work, the database table needs to have a
+        string column named "tag".
+        """
+        cls.delete_all(t, cls.tag.in_(list(tags)))
+
+    @classmethod
+    def delete_many_by_uuids(
+        cls, t: Transaction, uuids: Iterable[UUID]
+    ) -> None:
+        """Delete the entries with the given UUIDs using a single statement.
+
+        UUIDs without a matching entry are ignored.
+
+        For this method to work, the database table needs to have a
+        string column named "uuid".
+        """
+        cls.delete_all(t, cls._uuid.in_([str(u) for u in uuids]))
 
     def delete(self, t: Transaction) -> None:
         """Delete this entry from the database."""
         t.delete(self)
+
+
+def _is_entity_select(
+    t: Transaction, cls: type[DBObjectBase], stmt: Select[Any]
+) -> bool:
+    """Return whether a statement only selects and filters entities.
+
+    Ordering is ignored.
+    """
+    where = stmt.whereclause
+    plain = t.query(cls)
+    if isinstance(where, BooleanClauseList):
+        plain = plain.filter(*where.clauses)
+    elif where is not None:
+        plain = plain.filter(where)
+    return stmt.order_by(None).compare(plain.statement)
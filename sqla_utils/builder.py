@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
+from contextlib import AbstractContextManager
+from itertools import islice
 from os import PathLike
 from pathlib import Path
+from typing import NamedTuple
 
 from sqlalchemy import text
 from sqlalchemy.sql.elements import TextClause
@@ -12,6 +15,8 @@ from typing_extensions import TypeAlias
 from .split_sql import split_sql
 
 SQLExecutor: TypeAlias = "Callable[[TextClause], object]"
+SQLBatchExecutor: TypeAlias = "Callable[[Sequence[str]], object]"
+TransactionFactory: TypeAlias = "Callable[[], AbstractContextManager[object]]"
 
 
 class DependencyLoopError(Exception):
@@ -25,6 +30,24 @@ class DatabaseBuilder:
 
     SQL scripts can require other SQL scripts to be read beforehand.
 
+    By default, each statement is passed to the executor separately. If
+    a batch executor is supplied, it is called instead with lists of up to
+    batch_size raw SQL statements. This allows passing scripts to driver
+    APIs that can execute multiple statements in a single call.
+
+    If a transaction factory, like `Connection.begin`, is supplied, each
+    call to require() runs all required scripts in a single transaction,
+    instead of committing after each statement in autocommit setups. If
+    the transaction fails, none of the scripts are marked as applied.
+    This only holds if the executors don't commit themselves. For
+    example, sqlite3's executescript() commits pending transactions, so
+    don't pass a transaction factory together with a batch executor that
+    uses it.
+
+    If the database already contains some features, for example because it
+    was copied from a template, their names can be passed as parsed. These
+    scripts, and scripts requiring only them, will be skipped.
+
     >>> class MyEngine:
     ...     def execute(self, query):
     ...         print(query)
@@ -46,39 +69,106 @@ class DatabaseBuilder:
     """
 
     def __init__(
-        self, executor: SQLExecutor, path: PathLike[str] | str
+        self,
+        executor: SQLExecutor,
+        path: PathLike[str] | str,
+        *,
+        batch_executor: SQLBatchExecutor | None = None,
+        batch_size: int = 100,
+        begin: TransactionFactory | None = None,
+        parsed: Iterable[str] = (),
     ) -> None:
         self._executor = executor
+        self._begin = begin
+        self._batch_executor = batch_executor
+        self._batch_size = batch_size
         self._path = Path(path)
-        self._parsed: set[str] = set()
-        self._parsing: list[str] = []
+        self._parsed: set[str] = set(parsed)
+
+    @property
+    def parsed(self) -> frozenset[str]:
+        """Names of the features that were already applied."""
+        return frozenset(self._parsed)
 
     def require(self, *requirements: str) -> None:
+        if self._begin is None:
+            self._require_all(requirements)
+        else:
+            parsed = set(self._parsed)
+            try:
+                with self._begin():
+                    self._require_all(requirements)
+            except BaseException:
+                # The transaction was rolled back, so the scripts applied
+                # during this call are gone again.
+                self._parsed = parsed
+                raise
+
+    def _require_all(self, requirements: Iterable[str]) -> None:
         for requirement in requirements:
             if requirement not in self._parsed:
-                if requirement in self._parsing:
-                    raise DependencyLoopError(
-                        "dependency loop: " + requirement
-                    )
                 self._require_one(requirement)
-                self._parsed.add(requirement)
 
     def _require_one(self, requirement: str) -> None:
-        self._parsing.append(requirement)
-        try:
-            req_file = self._path / (requirement + ".sql")
-            with open(req_file) as f:
-                headers = _parse_sql_headers(f)
-                self._add_requires(headers.get("require", ""))
-            with open(req_file) as f:
-                _execute_sql_stream(self._executor, f)
-        finally:
-            self._parsing.pop()
-
-    def _add_requires(self, requires_string: str) -> None:
-        if requires_string.strip():
-            requires = [r.strip() for r in requires_string.split(",")]
-            self.require(*requires)
+        # Walk the dependency graph depth-first with an explicit stack of
+        # the requirements currently being parsed. Each entry holds the
+        # script and an iterator over its outstanding dependencies.
+        script = self._read_script(requirement)
+        stack = [(requirement, script, iter(script.requires))]
+        parsing = {requirement}
+        while stack:
+            name, script, dependencies = stack[-1]
+            dependency = next(dependencies, None)
+            if dependency is None:
+                stack.pop()
+                parsing.discard(name)
+                self._execute_script(script)
+                self._parsed.add(name)
+            elif dependency in parsing:
+                raise DependencyLoopError("dependency loop: " + dependency)
+            elif dependency not in self._parsed:
+                script = self._read_script(dependency)
+                stack.append((dependency, script, iter(script.requires)))
+                parsing.add(dependency)
+
+    def _read_script(self, requirement: str) -> _Script:
+        return _read_script(self._path / (requirement + ".sql"))
+
+    def _execute_script(self, script: _Script) -> None:
+        if self._batch_executor is None:
+            _execute_statements(self._executor, script.statements)
+        else:
+            _execute_batches(
+                self._batch_executor, script.statements, self._batch_size
+            )
+
+
+class _Script(NamedTuple):
+    stamp: tuple[int, int]
+    requires: list[str]
+    statements: list[str]
+
+
+_script_cache: dict[Path, _Script] = {}
+
+
+def _read_script(path: Path) -> _Script:
+    """Read and parse an SQL script.
+
+    Parsed scripts are cached until the modification time or the size
+    of the file changes.
+    """
+    path = path.absolute()
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    script = _script_cache.get(path)
+    if script is None or script.stamp != stamp:
+        lines = path.read_text().splitlines(keepends=True)
+        headers = _parse_sql_headers(lines)
+        requires = _parse_requires(headers.get("require", ""))
+        script = _Script(stamp, requires, list(split_sql(lines)))
+        _script_cache[path] = script
+    return script
 
 
 _SQL_LINE_RE = re.compile(
@@ -89,15 +179,36 @@ _SQL_LINE_RE = re.compile(
 def _parse_sql_headers(stream: Iterable[str]) -> dict[str, str]:
     matches = []
     for line in stream:
+        if not line.startswith("--"):
+            break
         m = _SQL_LINE_RE.match(line)
         if not m:
             break
         matches.append(m)
-    return {m.group(1).lower(): m.group(2).strip() for m in matches}
+    return {m[1].lower(): m[2].strip() for m in matches}
+
+
+def _parse_requires(requires_string: str) -> list[str]:
+    if not requires_string.strip():
+        return []
+    return [r.strip() for r in requires_string.split(",")]
 
 
-def _execute_sql_stream(executor: SQLExecutor, stream: Iterable[str]) -> None:
-    """Run the SQL statements in a stream against a database."""
-    for query in split_sql(stream):
+def _execute_statements(
+    executor: SQLExecutor, statements: Iterable[str]
+) -> None:
+    """Run SQL statements against a database."""
+    for query in statements:
         query = query.replace(":", "\\:")
         executor(text(query))
+
+
+def _execute_batches(
+    executor: SQLBatchExecutor, statements: Iterable[str], batch_size: int
+) -> None:
+    """Run SQL statements in batches against a database."""
+    it = iter(statements)
+    batch = list(islice(it, batch_size))
+    while batch:
+        executor(batch)
+        batch = list(islice(it, batch_size))
@@ -1,25 +1,67 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 
+# The descriptor that stores exception arguments at the C level.
+_BASE_ARGS: Any = BaseException.__dict__["args"]
+
 
 class DataError(Exception):
     """Base class for sqla-utils exceptions."""
 
 
 class DataItemError(DataError):
+    __slots__ = ("item_type", "field", "value", "_msg")
+
     def __init__(
         self,
         item_type: str,
         field: str | None,
         value: Any,
         *,
-        msg: str,
+        msg: str | None = None,
     ) -> None:
-        super().__init__(msg)
+        if msg is None:
+            super().__init__()
+        else:
+            super().__init__(msg)
         self.item_type = item_type
         self.field = field
         self.value = value
+        self._msg = msg
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Slot attributes are not part of the instance dict that
+        # BaseException pickles, so reconstruct from the fields instead.
+        factory = partial(type(self), msg=self._msg)
+        return factory, (self.item_type, self.field, self.value)
+
+    @property
+    def args(self) -> tuple[Any, ...]:
+        # Without a custom message, BaseException.args is empty, but callers
+        # expect the message as first argument, formatted on access.
+        return _BASE_ARGS.__get__(self) or (str(self),)
+
+    @args.setter
+    def args(self, value: tuple[Any, ...]) -> None:
+        _BASE_ARGS.__set__(self, value)
+
+    def __repr__(self) -> str:
+        # BaseException.__repr__() doesn't use the args property.
+        args = self.args
+        if len(args) == 1:
+            return f"{type(self).__name__}({args[0]!r})"
+        return f"{type(self).__name__}{args!r}"
+
+    def __str__(self) -> str:
+        # The default message is only formatted when it's actually needed.
+        if self._msg is None:
+            return self._default_message()
+        return self._msg
+
+    def _default_message(self) -> str:
+        return f"invalid '{self.item_type}' item"
 
 
 class UnknownItemError(DataItemError):
@@ -34,6 +76,8 @@ class UnknownItemError(DataItemError):
     value -- the value queried
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         item_type: str,
@@ -42,12 +86,14 @@ class UnknownItemError(DataItemError):
         *,
         msg: str | None = None,
     ) -> None:
-        if msg is None:
-            msg = f"unknown '{item_type}' item"
-            if field:
-                msg += f", no {field} with value '{value!r}'"
         super().__init__(item_type, field, value, msg=msg)
 
+    def _default_message(self) -> str:
+        msg = f"unknown '{self.item_type}' item"
+        if self.field:
+            msg += f", no {self.field} with value '{self.value!r}'"
+        return msg
+
 
 class DuplicateItemError(DataItemError):
     """A item can't be created because it already exists.
@@ -61,6 +107,8 @@ class DuplicateItemError(DataItemError):
     value -- the value queried
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         item_type: str,
@@ -69,8 +117,10 @@ class DuplicateItemError(DataItemError):
         *,
         msg: str | None = None,
     ) -> None:
-        if msg is None:
-            msg = f"duplicate '{item_type}' item"
-            if field:
-                msg += f" with value '{value!r}' for {field}"
         super().__init__(item_type, field, value, msg=msg)
+
+    def _default_message(self) -> str:
+        msg = f"duplicate '{self.item_type}' item"
+        if self.field:
+            msg += f" with value '{self.value!r}' for {self.field}"
+        return msg
@@ -14,6 +14,14 @@ class Session:
     Initialize by providing with a `sessionmaker` object.
 
     Must be used as context manager.
+
+    Compiled SQL statements are cached by the engine the session is bound
+    to. The size of this cache can be adjusted using the `query_cache_size`
+    argument to `create_engine()`. A larger cache can help applications that
+    use many different statements:
+
+    >>> engine = create_engine(url, query_cache_size=1200)
+    >>> session = Session(sessionmaker(bind=engine))
     """
 
     def __init__(self, session_maker: Callable[[], SASession]) -> None:
@@ -22,10 +30,9 @@ class Session:
         self._transaction: Transaction | None = None
 
     def __enter__(self) -> Session:
-        if self._session:
+        if self._session is not None:
             raise RuntimeError("session already entered")
         self._session = self._session_maker()
-        assert self._session
         self._transaction = Transaction(self._session)
         return self
 
@@ -35,14 +42,15 @@ class Session:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        if not self._session:
+        session = self._session
+        if session is None:
             raise RuntimeError("not in a session context")
-        if self._session.is_active:
+        if session.is_active:
             if exc_type:
-                self._session.rollback()
+                session.rollback()
             else:
-                self._session.commit()
-        self._session.close()
+                session.commit()
+        session.close()
         self._session = None
         self._transaction = None
 
@@ -63,6 +71,4 @@ class Session:
 
         It is not possible to nest calls to begin_transaction().
         """
-        if not self._transaction:
-            raise RuntimeError("not in a session context")
-        return self._transaction
+        return self.transaction
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Generator, Iterable, Iterator
 
 _SQL_COMMENT_START = "--"
@@ -13,61 +14,73 @@ _DELIMITER_LINE_RE = re.compile(r"^\s*delimiter\s+(.*)\s*$", re.IGNORECASE)
 def split_sql(stream: Iterable[str]) -> Iterator[str]:
     """Return an iterator over the SQL statements in a stream.
 
+    The stream is an iterable of lines, such as an open file. A string
+    containing the whole script is accepted as well.
+
     >>> list(split_sql("SELECT * FROM foo; DELETE FROM foo;"))
-    ... ['SELECT * FROM foo', 'DELETE FROM foo']
+    ['SELECT * FROM foo', 'DELETE FROM foo']
     """
+    if isinstance(stream, str):
+        stream = stream.splitlines(keepends=True)
     return _SQLSplitter(stream).split()
 
 
+@lru_cache(maxsize=None)
+def _token_re(stmt_delimiter: str) -> re.Pattern[str]:
+    """Return a regex matching all tokens relevant for splitting.
+
+    The alternatives are ordered by precedence: comments, statement
+    delimiters, and string delimiters.
+    """
+    tokens = [_SQL_COMMENT_START, stmt_delimiter, _SQL_STRING_DELIMITER]
+    return re.compile("|".join(re.escape(t) for t in tokens))
+
+
 class _SQLSplitter:
     def __init__(self, stream: Iterable[str]) -> None:
         self._stream = stream
-        self._current_stmt = ""
+        self._current_stmt: list[str] = []
         self._in_string = False
         self._stmt_delimiter = _SQL_STATEMENT_DELIMITER
+        self._token_re = _token_re(self._stmt_delimiter)
         self._line = ""
 
     def split(self) -> Iterator[str]:
         for self._line in self._stream:
             yield from self._parse_line()
-        if self._current_stmt.strip():
-            yield self._current_stmt.strip()
+        stmt = self._end_statement()
+        if stmt:
+            yield stmt
 
     def _parse_line(self) -> Generator[str, None, None]:
         m = _DELIMITER_LINE_RE.match(self._line)
         if m:
             self._stmt_delimiter = m.group(1)
+            self._token_re = _token_re(self._stmt_delimiter)
         else:
             yield from self._parse_sql_line()
 
     def _parse_sql_line(self) -> Generator[str, None, None]:
-        self._pos = 0
-        while self._pos < len(self._line):
-            if self._at_comment_start():
-                break
-            elif self._at_statement_delimiter():
-                if self._current_stmt.strip():
-                    yield self._current_stmt.strip()
-                self._current_stmt = ""
-                self._pos += len(self._stmt_delimiter)
-            elif self._at_string_delimiter():
-                self._in_string = not self._in_string
-                self._current_stmt += _SQL_STRING_DELIMITER
-                self._pos += len(_SQL_STRING_DELIMITER)
+        line = self._line
+        pos = 0
+        for m in self._token_re.finditer(line):
+            token = m.group()
+            if token == _SQL_COMMENT_START:
+                self._current_stmt.append(line[pos : m.start()])
+                return
+            elif token == self._stmt_delimiter:
+                if self._in_string:
+                    continue
+                self._current_stmt.append(line[pos : m.start()])
+                stmt = self._end_statement()
+                if stmt:
+                    yield stmt
+                pos = m.end()
             else:
-                self._current_stmt += self._line[self._pos]
-                self._pos += 1
-
-    def _at_comment_start(self) -> bool:
-        return self._current_pos_startswith(_SQL_COMMENT_START)
-
-    def _at_statement_delimiter(self) -> bool:
-        if self._in_string:
-            return False
-        return self._current_pos_startswith(self._stmt_delimiter)
-
-    def _at_string_delimiter(self) -> bool:
-        return self._current_pos_startswith(_SQL_STRING_DELIMITER)
+                self._in_string = not self._in_string
+        self._current_stmt.append(line[pos:])
 
-    def _current_pos_startswith(self, s: str) -> bool:
-        return self._line[self._pos :].startswith(s)
+    def _end_statement(self) -> str:
+        stmt = "".join(self._current_stmt).strip()
+        self._current_stmt.clear()
+        return stmt
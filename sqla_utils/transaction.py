@@ -3,12 +3,14 @@ from __future__ import annotations
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, TypeVar, overload
 
-from sqlalchemy import text
+from sqlalchemy import inspect, select, tuple_
 from sqlalchemy.engine import Connection, Result
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Mapper, Query, Session, object_mapper
 from sqlalchemy.schema import Table
 from sqlalchemy.sql import ColumnElement
 
+from ._util import cached_text
+
 if TYPE_CHECKING:
     from sqlalchemy.engine.interfaces import (
         _CoreAnyExecuteParams,
@@ -47,15 +49,15 @@ class Transaction:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
+        if exc_type:
+            self.session.rollback()
+            return
+        # Committing flushes pending changes, so no separate flush is needed.
         try:
-            self.session.flush()
+            self.session.commit()
         except BaseException:
             self.session.rollback()
             raise
-        if exc_type:
-            self.session.rollback()
-        else:
-            self.session.commit()
 
     @overload
     def query(self, entities: Table, **kwargs: Any) -> Query[Any]: ...
@@ -80,16 +82,27 @@ class Transaction:
         """Wrapper around Session.query()."""
         return self.session.query(*entities, **kwargs)
 
-    def add(self, *instances: Any) -> None:
-        """Save one or more objects to the database."""
+    def add(self, *instances: Any, flush: bool = True) -> None:
+        """Save one or more objects to the database.
+
+        By default, the objects are flushed immediately. Pass flush=False
+        to defer this to the next flush or commit, which allows adding
+        many objects in a loop without a round trip for each one.
+        """
         self.session.add_all(instances)
-        self.flush(*instances)
+        if flush:
+            self.flush(*instances)
+
+    def delete(self, *instances: Any, flush: bool = True) -> None:
+        """Mark one or more instances as deleted.
 
-    def delete(self, *instances: Any) -> None:
-        """Mark one or more instances as deleted."""
+        By default, the deletions are flushed immediately. Pass
+        flush=False to defer this to the next flush or commit.
+        """
         for obj in instances:
             self.session.delete(obj)
-        self.flush(*instances)
+        if flush:
+            self.flush(*instances)
 
     def flush(self, *objects: Any) -> None:
         """Flush object changes to the database.
@@ -106,10 +119,40 @@ class Transaction:
     def refresh(self, *instances: Any) -> None:
         """Wrapper around Session.refresh.
 
-        Can be called with multiple instances.
+        Can be called with multiple instances. Multiple instances of the
+        same class are reloaded using a single query.
         """
+        groups: dict[Mapper[Any], list[Any]] = {}
+        for instance in instances:
+            # object_mapper() raises the same UnmappedInstanceError as
+            # Session.refresh() for unmapped objects.
+            groups.setdefault(object_mapper(instance), []).append(instance)
+        for mapper, group in groups.items():
+            self._refresh_many(mapper, group)
+
+    def _refresh_many(self, mapper: Mapper[Any], instances: list[Any]) -> None:
+        identities = [inspect(o).identity for o in instances]
+        if len(instances) == 1 or None in identities:
+            # Session.refresh() is just as fast for single instances and
+            # raises the appropriate error for non-persistent instances.
+            for instance in instances:
+                self.session.refresh(instance)
+            return
+        pk = mapper.primary_key
+        if len(pk) == 1:
+            condition = pk[0].in_([i[0] for i in identities])
+        else:
+            condition = tuple_(*pk).in_(identities)
+        stmt = select(mapper).where(condition)
+        stmt = stmt.execution_options(populate_existing=True)
+        # Like Session.refresh(), discard pending changes of the instances
+        # instead of flushing them before reloading.
+        with self.session.no_autoflush:
+            loaded = {id(o) for o in self.session.execute(stmt).scalars()}
         for instance in instances:
-            self.session.refresh(instance)
+            if id(instance) not in loaded:
+                # The row is gone, let Session.refresh() raise an error.
+                self.session.refresh(instance)
 
     def expire_all(self) -> None:
         """Wrapper around Session.expire_all()."""
@@ -122,7 +165,7 @@ class Transaction:
     ) -> Result[tuple[Any, ...]]:
         """Wrapper around Session.execute()."""
         if isinstance(query, str):
-            query = text(query)
+            query = cached_text(query)
         result: Result[tuple[Any, ...]] = self.session.execute(query, args)
         return result
 
@@ -133,5 +176,5 @@ class Transaction:
     ) -> Any:
         """Wrapper around Session.scalar()."""
         if isinstance(query, str):
-            query = text(query)
+            query = cached_text(query)
         return self.session.scalar(query, params)
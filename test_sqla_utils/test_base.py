@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.orm import Query, Session
+
+from sqla_utils.base import DBObjectBase
+from sqla_utils.exc import UnknownItemError
+from sqla_utils.transaction import Transaction
+
+UUID1 = UUID("a9a1b4dc-1b43-4d1d-9bb5-3f1c7d1b0a01")
+UUID2 = UUID("a9a1b4dc-1b43-4d1d-9bb5-3f1c7d1b0a02")
+UUID3 = UUID("a9a1b4dc-1b43-4d1d-9bb5-3f1c7d1b0a03")
+
+
+class DBItem(DBObjectBase):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    tag = Column(String(20), nullable=False, unique=True)
+    _uuid = Column("uuid", String(36), nullable=False, unique=True)
+
+
+@pytest.fixture
+def t() -> Generator[Transaction, None, None]:
+    engine = create_engine("sqlite:///:memory:")
+    DBObjectBase.metadata.create_all(engine)
+    with Session(engine) as session:
+        with Transaction(session) as t:
+            t.add(
+                DBItem(id=1, tag="one", _uuid=str(UUID1)),
+                DBItem(id=2, tag="two", _uuid=str(UUID2)),
+            )
+            yield t
+
+
+class TestFetchMany:
+    def test_by_ids(self, t: Transaction) -> None:
+        items = DBItem.fetch_many_by_ids(t, [1, 2, 3])
+        assert sorted(items) == [1, 2]
+        assert items[2].tag == "two"
+
+    def test_by_tags(self, t: Transaction) -> None:
+        items = DBItem.fetch_many_by_tags(t, iter(["two", "three"]))
+        assert list(items) == ["two"]
+        assert items["two"].id == 2
+
+    def test_by_uuids(self, t: Transaction) -> None:
+        items = DBItem.fetch_many_by_uuids(t, [UUID1, UUID3])
+        assert list(items) == [UUID1]
+        assert items[UUID1].id == 1
+
+    def test_empty(self, t: Transaction) -> None:
+        assert DBItem.fetch_many_by_ids(t, []) == {}
+
+
+class TestDeleteMany:
+    def test_by_ids(self, t: Transaction) -> None:
+        DBItem.delete_many_by_ids(t, [1, 3])
+        assert [o.id for o in DBItem.fetch_all(t)] == [2]
+
+    def test_by_tags(self, t: Transaction) -> None:
+        DBItem.delete_many_by_tags(t, ["one", "two"])
+        assert DBItem.count(t) == 0
+
+    def test_by_uuids(self, t: Transaction) -> None:
+        DBItem.delete_many_by_uuids(t, [UUID2])
+        assert [o.id for o in DBItem.fetch_all(t)] == [1]
+
+
+class TestDeleteOne:
+    def test_delete(self, t: Transaction) -> None:
+        DBItem.delete_one(t, DBItem.tag == "one")
+        assert [o.id for o in DBItem.fetch_all(t)] == [2]
+
+    def test_unknown(self, t: Transaction) -> None:
+        with pytest.raises(UnknownItemError):
+            DBItem.delete_one(t, DBItem.tag == "three")
+        assert DBItem.count(t) == 2
+
+    def test_unknown_without_check(self, t: Transaction) -> None:
+        DBItem.delete_one(t, DBItem.tag == "three", check_existence=False)
+        assert DBItem.count(t) == 2
+
+
+def test_item_type() -> None:
+    assert DBItem.item_type() == "items"
+
+
+class TestFetchBy:
+    def test_by_id(self, t: Transaction) -> None:
+        assert DBItem.fetch_by_id(t, 2).tag == "two"
+        assert DBItem.fetch_by_id(t, 1).tag == "one"
+
+    def test_by_tag(self, t: Transaction) -> None:
+        assert DBItem.fetch_by_tag(t, "two").id == 2
+
+    def test_by_uuid(self, t: Transaction) -> None:
+        assert DBItem.fetch_by_uuid(t, UUID1).id == 1
+
+    def test_unknown(self, t: Transaction) -> None:
+        with pytest.raises(UnknownItemError) as exc_info:
+            DBItem.fetch_by_id(t, 3)
+        assert exc_info.value.field == "id"
+        assert exc_info.value.value == 3
+
+
+class DBSoftItem(DBObjectBase):
+    __tablename__ = "soft_items"
+
+    id = Column(Integer, primary_key=True)
+    tag = Column(String(20), nullable=False, unique=True)
+    deleted = Column(Integer, nullable=False, default=0)
+
+    @classmethod
+    def query(
+        cls, t: Transaction, *conditions: Any, order_by: Any | None = None
+    ) -> Query[DBSoftItem]:
+        return super().query(
+            t, cls.deleted == 0, *conditions, order_by=order_by
+        )
+
+
+def test_fetch_by_honours_query_override(t: Transaction) -> None:
+    t.add(DBSoftItem(id=1, tag="one", deleted=1), DBSoftItem(id=2, tag="two"))
+    assert DBSoftItem.fetch_by_id(t, 2).tag == "two"
+    with pytest.raises(UnknownItemError):
+        DBSoftItem.fetch_by_id(t, 1)
+    with pytest.raises(UnknownItemError):
+        DBSoftItem.fetch_by_tag(t, "one")
+
+
+def test_count_honours_query_override(t: Transaction) -> None:
+    t.add(DBSoftItem(id=1, tag="one", deleted=1), DBSoftItem(id=2, tag="two"))
+    assert DBSoftItem.count(t) == 1
+    assert DBSoftItem.count(t, DBSoftItem.tag == "one") == 0
+
+
+class DBLimitedItem(DBObjectBase):
+    __tablename__ = "limited_items"
+
+    id = Column(Integer, primary_key=True)
+
+    @classmethod
+    def query(
+        cls, t: Transaction, *conditions: Any, order_by: Any | None = None
+    ) -> Query[DBLimitedItem]:
+        return super().query(t, *conditions, order_by=order_by).limit(2)
+
+
+def test_count_honours_limit_in_query_override(t: Transaction) -> None:
+    t.add(*(DBLimitedItem(id=i) for i in range(5)))
+    assert DBLimitedItem.count(t) == 2
+    assert DBLimitedItem.count(t) == len(DBLimitedItem.fetch_all(t))
+
+
+class DBTaggedItem(DBObjectBase):
+    __tablename__ = "tagged_items"
+
+    id = Column(Integer, primary_key=True)
+
+    @classmethod
+    def query(
+        cls, t: Transaction, *conditions: Any, order_by: Any | None = None
+    ) -> Query[DBTaggedItem]:
+        return (
+            super()
+            .query(t, *conditions, order_by=order_by)
+            .join(DBItemTag, DBItemTag.item_id == cls.id)
+            .distinct()
+        )
+
+
+class DBItemTag(DBObjectBase):
+    __tablename__ = "item_tags"
+
+    id = Column(Integer, primary_key=True)
+    item_id = Column(Integer, nullable=False)
+
+
+def test_count_honours_distinct_in_query_override(t: Transaction) -> None:
+    t.add(
+        DBTaggedItem(id=1),
+        DBTaggedItem(id=2),
+        DBTaggedItem(id=3),
+        DBItemTag(id=1, item_id=1),
+        DBItemTag(id=2, item_id=1),
+        DBItemTag(id=3, item_id=2),
+    )
+    assert DBTaggedItem.count(t) == 2
+    assert DBTaggedItem.count(t) == len(DBTaggedItem.fetch_all(t))
+
+
+class DBUnionItem(DBObjectBase):
+    __tablename__ = "union_items"
+
+    id = Column(Integer, primary_key=True)
+
+    @classmethod
+    def query(
+        cls, t: Transaction, *conditions: Any, order_by: Any | None = None
+    ) -> Query[DBUnionItem]:
+        q = super().query(t, *conditions, order_by=order_by)
+        return q.filter(cls.id < 2).union(q.filter(cls.id > 3))
+
+
+def test_count_honours_union_in_query_override(t: Transaction) -> None:
+    t.add(*(DBUnionItem(id=i) for i in range(6)))
+    assert DBUnionItem.count(t) == 4
+    assert DBUnionItem.count(t) == len(DBUnionItem.fetch_all(t))
+
+
+class TestDeleteBy:
+    def test_by_id(self, t: Transaction) -> None:
+        DBItem.delete_by_id(t, 1)
+        assert [o.id for o in DBItem.fetch_all(t)] == [2]
+
+    def test_by_tag(self, t: Transaction) -> None:
+        DBItem.delete_by_tag(t, "two")
+        assert [o.id for o in DBItem.fetch_all(t)] == [1]
+
+    def test_by_uuid(self, t: Transaction) -> None:
+        DBItem.delete_by_uuid(t, UUID2)
+        assert [o.id for o in DBItem.fetch_all(t)] == [1]
+
+    def test_unknown(self, t: Transaction) -> None:
+        with pytest.raises(UnknownItemError) as exc_info:
+            DBItem.delete_by_uuid(t, UUID3)
+        assert exc_info.value.field == "uuid"
+        assert exc_info.value.value == UUID3
+
+    def test_unknown_without_check(self, t: Transaction) -> None:
+        DBItem.delete_by_id(t, 3, check_existence=False)
+        assert DBItem.count(t) == 2
+
+
+def test_count(t: Transaction) -> None:
+    assert DBItem.count(t) == 2
+    assert DBItem.count(t, DBItem.tag == "one") == 1
+    assert DBItem.count(t, DBItem.tag == "one", DBItem.id == 2) == 0
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from collections.abc import Generator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.sql.elements import TextClause
+
+from sqla_utils.builder import DatabaseBuilder, DependencyLoopError
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def __call__(self, query: TextClause) -> None:
+        self.queries.append(query.text)
+
+
+@pytest.fixture
+def recorder() -> Recorder:
+    return Recorder()
+
+
+def write_sql(path: Path, name: str, content: str) -> None:
+    (path / f"{name}.sql").write_text(content)
+
+
+def test_require(tmp_path: Path, recorder: Recorder) -> None:
+    write_sql(tmp_path, "foo", "SELECT 1;\nSELECT 2;\n")
+    DatabaseBuilder(recorder, tmp_path).require("foo")
+    assert recorder.queries == ["SELECT 1", "SELECT 2"]
+
+
+def test_require_dependencies(tmp_path: Path, recorder: Recorder) -> None:
+    write_sql(tmp_path, "foo", "-- Require: bar, baz\n\nSELECT 'foo';\n")
+    write_sql(tmp_path, "bar", "-- Require: baz\n\nSELECT 'bar';\n")
+    write_sql(tmp_path, "baz", "SELECT 'baz';\n")
+    builder = DatabaseBuilder(recorder, tmp_path)
+    builder.require("foo")
+    builder.require("bar")
+    assert recorder.queries == ["SELECT 'baz'", "SELECT 'bar'", "SELECT 'foo'"]
+
+
+def test_dependency_loop(tmp_path: Path, recorder: Recorder) -> None:
+    write_sql(tmp_path, "foo", "-- Require: bar\n\nSELECT 'foo';\n")
+    write_sql(tmp_path, "bar", "-- Require: foo\n\nSELECT 'bar';\n")
+    with pytest.raises(DependencyLoopError):
+        DatabaseBuilder(recorder, tmp_path).require("foo")
+
+
+def test_escape_colons(tmp_path: Path, recorder: Recorder) -> None:
+    write_sql(tmp_path, "foo", "SELECT '12:30';\n")
+    DatabaseBuilder(recorder, tmp_path).require("foo")
+    assert recorder.queries == ["SELECT '12\\:30'"]
+
+
+def test_batch_executor(tmp_path: Path, recorder: Recorder) -> None:
+    write_sql(tmp_path, "foo", "SELECT 1;\nSELECT 2;\nSELECT '12:30';\n")
+    batches: list[Sequence[str]] = []
+    builder = DatabaseBuilder(
+        recorder, tmp_path, batch_executor=batches.append, batch_size=2
+    )
+    builder.require("foo")
+    assert batches == [["SELECT 1", "SELECT 2"], ["SELECT '12:30'"]]
+    assert recorder.queries == []
+
+
+def test_deep_dependency_chain(tmp_path: Path, recorder: Recorder) -> None:
+    depth = 2000
+    for i in range(depth):
+        write_sql(tmp_path, f"f{i}", f"-- Require: f{i + 1}\n\nSELECT {i};\n")
+    write_sql(tmp_path, f"f{depth}", f"SELECT {depth};\n")
+    DatabaseBuilder(recorder, tmp_path).require("f0")
+    assert recorder.queries[0] == f"SELECT {depth}"
+    assert recorder.queries[-1] == "SELECT 0"
+
+
+def test_reread_modified_script(tmp_path: Path, recorder: Recorder) -> None:
+    write_sql(tmp_path, "foo", "SELECT 1;\n")
+    DatabaseBuilder(recorder, tmp_path).require("foo")
+    write_sql(tmp_path, "foo", "SELECT 42;\n")
+    DatabaseBuilder(recorder, tmp_path).require("foo")
+    assert recorder.queries == ["SELECT 1", "SELECT 42"]
+
+
+def test_transaction(tmp_path: Path, recorder: Recorder) -> None:
+    write_sql(tmp_path, "foo", "-- Require: bar\n\nSELECT 'foo';\n")
+    write_sql(tmp_path, "bar", "SELECT 'bar';\n")
+
+    @contextmanager
+    def begin() -> Generator[None, None, None]:
+        recorder.queries.append("BEGIN")
+        yield
+        recorder.queries.append("COMMIT")
+
+    DatabaseBuilder(recorder, tmp_path, begin=begin).require("foo")
+    assert recorder.queries == [
+        "BEGIN",
+        "SELECT 'bar'",
+        "SELECT 'foo'",
+        "COMMIT",
+    ]
+
+
+def test_parsed(tmp_path: Path, recorder: Recorder) -> None:
+    write_sql(tmp_path, "foo", "-- Require: bar\n\nSELECT 'foo';\n")
+    write_sql(tmp_path, "bar", "SELECT 'bar';\n")
+    builder = DatabaseBuilder(recorder, tmp_path, parsed=["bar"])
+    builder.require("bar", "foo")
+    assert recorder.queries == ["SELECT 'foo'"]
+    assert builder.parsed == {"foo", "bar"}
+
+
+def test_transaction_rollback(tmp_path: Path) -> None:
+    write_sql(tmp_path, "a", "INSERT INTO t VALUES (1);\n")
+    write_sql(
+        tmp_path, "b", "-- Require: a\n\nINSERT INTO missing VALUES (1);\n"
+    )
+    engine = create_engine("sqlite://", future=True)
+    with engine.connect() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER)"))
+        conn.commit()
+        builder = DatabaseBuilder(conn.execute, tmp_path, begin=conn.begin)
+        with pytest.raises(OperationalError):
+            builder.require("b")
+        assert builder.parsed == set()
+        assert conn.execute(text("SELECT * FROM t")).all() == []
+        conn.rollback()
+        builder.require("a")
+        assert conn.execute(text("SELECT * FROM t")).all() == [(1,)]
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from sqla_utils.exc import DuplicateItemError, UnknownItemError
+
+
+class TestUnknownItemError:
+    def test_default_message(self) -> None:
+        assert str(UnknownItemError("items")) == "unknown 'items' item"
+        e = UnknownItemError("items", "id", 3)
+        assert str(e) == "unknown 'items' item, no id with value '3'"
+        assert e.args == ("unknown 'items' item, no id with value '3'",)
+        assert (
+            repr(e) == "UnknownItemError(\"unknown 'items' item, "
+            "no id with value '3'\")"
+        )
+
+    def test_custom_message(self) -> None:
+        e = UnknownItemError("items", "id", 3, msg="no such item")
+        assert str(e) == "no such item"
+        assert e.args == ("no such item",)
+        assert repr(e) == "UnknownItemError('no such item')"
+
+
+class TestDuplicateItemError:
+    def test_default_message(self) -> None:
+        assert str(DuplicateItemError("items")) == "duplicate 'items' item"
+        e = DuplicateItemError("items", "tag", "foo")
+        assert str(e) == "duplicate 'items' item with value ''foo'' for tag"
+
+    def test_custom_message(self) -> None:
+        e = DuplicateItemError("items", "tag", "foo", msg="already exists")
+        assert str(e) == "already exists"
+
+
+@pytest.mark.parametrize("msg", [None, "custom message"])
+def test_pickle(msg: str | None) -> None:
+    e = UnknownItemError("items", "id", 3, msg=msg)
+    copy = pickle.loads(pickle.dumps(e))
+    assert type(copy) is UnknownItemError
+    assert (copy.item_type, copy.field, copy.value) == ("items", "id", 3)
+    assert str(copy) == str(e)
+    assert copy.args == e.args
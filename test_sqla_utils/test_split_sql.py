@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from sqla_utils.split_sql import split_sql
+
+
+def test_split_statements() -> None:
+    sql = ["SELECT * FROM foo; DELETE FROM foo;\n", "SELECT 1\n"]
+    assert list(split_sql(sql)) == [
+        "SELECT * FROM foo",
+        "DELETE FROM foo",
+        "SELECT 1",
+    ]
+
+
+def test_multi_line_statement() -> None:
+    sql = ["SELECT *\n", "FROM foo;\n"]
+    assert list(split_sql(sql)) == ["SELECT *\nFROM foo"]
+
+
+def test_ignore_empty_statements() -> None:
+    assert list(split_sql([";;\n", "  ;\n"])) == []
+
+
+def test_comments() -> None:
+    sql = ["-- Require: bar\n", "SELECT 1; -- SELECT 2;\n", "SELECT 3;\n"]
+    assert list(split_sql(sql)) == ["SELECT 1", "SELECT 3"]
+
+
+def test_delimiter_in_string() -> None:
+    sql = ["INSERT INTO foo VALUES ('a;b');\n", "SELECT 'it''s';\n"]
+    assert list(split_sql(sql)) == [
+        "INSERT INTO foo VALUES ('a;b')",
+        "SELECT 'it''s'",
+    ]
+
+
+def test_multi_line_string() -> None:
+    sql = ["SELECT 'a;\n", "b';\n"]
+    assert list(split_sql(sql)) == ["SELECT 'a;\nb'"]
+
+
+def test_custom_delimiter() -> None:
+    sql = [
+        "DELIMITER //\n",
+        "CREATE TRIGGER t BEGIN SELECT 1; SELECT 2; END//\n",
+        "DELIMITER ;\n",
+        "SELECT 3;\n",
+    ]
+    assert list(split_sql(sql)) == [
+        "CREATE TRIGGER t BEGIN SELECT 1; SELECT 2; END",
+        "SELECT 3",
+    ]
+
+
+def test_split_string() -> None:
+    sql = "SELECT 1; -- comment;\nDELIMITER //\nSELECT 2; SELECT 3//\n"
+    assert list(split_sql(sql)) == ["SELECT 1", "SELECT 2; SELECT 3"]
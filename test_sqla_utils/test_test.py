@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import sqlite3
 from collections.abc import Generator
+from contextlib import closing
 from pathlib import Path
+from threading import Thread
+from typing import Any
 
 import pytest
+from sqlalchemy import func, text
+from sqlalchemy.exc import CompileError
 
-from sqla_utils.test import DBFixture
+from sqla_utils.test import DBFixture, assert_one_row_equals
 
 
 class ExampleFixture(DBFixture):
@@ -30,21 +36,352 @@ class TestDBFixture:
         assert fix.select_sql("SELECT 1") == [(1,)]
         assert fix.select_sql("SELECT :arg", {"arg": 42}) == [(42,)]
 
+    def test_iter_sql(self, fix: ExampleFixture) -> None:
+        rows = fix.iter_sql("SELECT 1 UNION SELECT 2")
+        assert next(rows) == (1,)
+        rows.close()
+        assert list(fix.iter_sql("SELECT :arg", {"arg": 42})) == [(42,)]
+
     def test_select_sql_one_row(self, fix: ExampleFixture) -> None:
         assert fix.select_sql_one_row("SELECT 1") == (1,)
         assert fix.select_sql_one_row("SELECT :arg", {"arg": 42}) == (42,)
+        with pytest.raises(AssertionError, match="no rows"):
+            fix.select_sql_one_row("SELECT 1 WHERE 0")
+        with pytest.raises(AssertionError, match="more than one row"):
+            fix.select_sql_one_row("SELECT 1 UNION SELECT 2 UNION SELECT 3")
 
     def test_select_all_rows(self, fix: ExampleFixture) -> None:
         fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
         fix.execute_sql("INSERT INTO test VALUES (42, 'foo')")
         assert fix.select_all_rows("test") == [(42, "foo")]
 
+    def test_iter_rows(self, fix: ExampleFixture) -> None:
+        fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+        fix.execute_sql("INSERT INTO test VALUES (1, 'foo'), (2, 'bar')")
+        fix.execute_sql("INSERT INTO test VALUES (3, 'baz')")
+        rows = fix.iter_rows("test", chunk=2)
+        assert next(rows) == (1, "foo")
+        rows.close()
+        assert list(fix.iter_rows("test", chunk=2)) == [
+            (1, "foo"),
+            (2, "bar"),
+            (3, "baz"),
+        ]
+
     def test_insert(self, fix: ExampleFixture) -> None:
         fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
         fix.insert("test", {"id": 42, "text": "foo"})
         assert fix.select_sql("SELECT id, text FROM test") == [(42, "foo")]
 
+    def test_insert_expression(self, fix: ExampleFixture) -> None:
+        fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+        fix.insert("test", {"id": 1, "text": func.upper("foo")})
+        assert fix.select_sql("SELECT id, text FROM test") == [(1, "FOO")]
+
+    def test_insert_unknown_column(self, fix: ExampleFixture) -> None:
+        fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+        with pytest.raises(CompileError):
+            fix.insert("test", {"id": 1, "bogus": 2})
+        fix.assert_table_is_empty("test")
+
+    def test_insert_list(self, fix: ExampleFixture) -> None:
+        fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+        fix.insert(
+            "test", [{"id": 1, "text": "foo"}, {"id": 2, "text": "bar"}]
+        )
+        fix.insert("test", [3, "baz"])
+        assert fix.select_sql("SELECT id, text FROM test ORDER BY id") == [
+            (1, "foo"),
+            (2, "bar"),
+            (3, "baz"),
+        ]
+
+    def test_insert_many(self, fix: ExampleFixture) -> None:
+        fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+        fix.insert_many(
+            "test", [{"id": 1, "text": "foo"}, {"id": 2, "text": "bar"}]
+        )
+        fix.insert_many("test", [])
+        assert fix.select_sql("SELECT id, text FROM test ORDER BY id") == [
+            (1, "foo"),
+            (2, "bar"),
+        ]
+
+    def test_insert_many_expression(self, fix: ExampleFixture) -> None:
+        fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+        fix.insert(
+            "test",
+            [{"id": 1, "text": func.upper("foo")}, {"id": 2, "text": "bar"}],
+        )
+        assert fix.select_sql("SELECT id, text FROM test ORDER BY id") == [
+            (1, "FOO"),
+            (2, "bar"),
+        ]
+
+    def test_insert_many_unknown_column(self, fix: ExampleFixture) -> None:
+        fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+        with pytest.raises(CompileError):
+            fix.insert("test", [{"id": 1, "bogus": 2}])
+        with pytest.raises(CompileError):
+            fix.insert_many("test", [{"id": 1}, {"id": 2, "bogus": 2}])
+        fix.assert_table_is_empty("test")
+
+    def test_insert_many_batches(self, fix: ExampleFixture) -> None:
+        fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+        rows = ({"id": i, "text": "foo"} for i in range(5))
+        fix.insert_many("test", rows, batch_size=2)
+        fix.assert_rows_equal("test", [{"id": i} for i in range(5)])
+
     def test_assert_row_equals(self, fix: ExampleFixture) -> None:
         fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
         fix.execute_sql("INSERT INTO test VALUES (42, 'foo')")
         fix.assert_only_row_equals("test", {"id": 42, "text": "foo"})
+
+    def test_select_only_row(self, fix: ExampleFixture) -> None:
+        fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+        with pytest.raises(AssertionError, match="got 0"):
+            fix.select_only_row("test")
+        fix.execute_sql("INSERT INTO test VALUES (1, 'foo')")
+        assert fix.select_only_row("test") == (1, "foo")
+        fix.execute_sql("INSERT INTO test VALUES (2, 'bar'), (3, 'baz')")
+        with pytest.raises(AssertionError, match="got 3"):
+            fix.select_only_row("test")
+
+    def test_assert_row_count(self, fix: ExampleFixture) -> None:
+        fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+        fix.assert_table_is_empty("test")
+        fix.execute_sql("INSERT INTO test VALUES (1, 'foo'), (2, 'bar')")
+        fix.assert_row_count("test", 2)
+        with pytest.raises(AssertionError, match="contains 2 rows"):
+            fix.assert_table_is_empty("test")
+
+    def test_assert_rows_equal(self, fix: ExampleFixture) -> None:
+        fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+        fix.execute_sql("INSERT INTO test VALUES (1, 'foo'), (2, 'foo')")
+        fix.execute_sql("INSERT INTO test VALUES (3, 'bar')")
+        fix.assert_rows_equal(
+            "test", [{"text": "foo"}, {"text": "bar"}, {"text": "foo"}]
+        )
+        fix.assert_rows_equal(
+            "test", [{"id": 3}, {"id": 1, "text": "foo"}, {"text": "foo"}]
+        )
+        with pytest.raises(pytest.fail.Exception):
+            fix.assert_rows_equal(
+                "test", [{"text": "foo"}, {"text": "bar"}, {"text": "bar"}]
+            )
+        with pytest.raises(pytest.fail.Exception):
+            fix.assert_rows_equal(
+                "test", [{"id": 3}, {"text": "bar"}, {"id": 1}]
+            )
+        fix.assert_rows_equal("test", [{}, {}, {}])
+        fix.assert_rows_equal("test", [{"id": 2}, {"id": 1}, {"id": 3}])
+
+    def test_assert_rows_equal_ordered(self, fix: ExampleFixture) -> None:
+        fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+        fix.insert_many("test", [{"id": i, "text": "foo"} for i in range(6)])
+        fix.assert_rows_equal("test", [{"id": i} for i in range(6)])
+        fix.assert_rows_equal("test", [{"id": i} for i in reversed(range(6))])
+        with pytest.raises(pytest.fail.Exception):
+            fix.assert_rows_equal("test", [{"id": i} for i in range(1, 7)])
+
+    def test_assert_any_row_equals(self, fix: ExampleFixture) -> None:
+        fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+        fix.execute_sql("INSERT INTO test VALUES (1, 'foo'), (2, 'bar')")
+        fix.assert_any_row_equals("test", {"id": 2, "text": "bar"})
+        with pytest.raises(pytest.fail.Exception):
+            fix.assert_any_row_equals("test", {"id": 2, "text": "foo"})
+
+    def test_assert_any_row_equals_keeps_session_changes(
+        self, fix: ExampleFixture
+    ) -> None:
+        fix.execute_sql("CREATE TABLE pending (id INTEGER)")
+        fix.insert("pending", {"id": 1})
+        with fix.session.begin_transaction() as t:
+            t.execute("INSERT INTO pending VALUES (2)")
+            fix.assert_any_row_equals("pending", {"id": 2})
+            fix.assert_any_row_equals("pending", {"id": 1})
+            assert t.scalar("SELECT COUNT(*) FROM pending") == 2
+        fix.assert_row_count("pending", 2)
+
+    def test_session(self, fix: ExampleFixture) -> None:
+        fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+        fix.insert("test", {"id": 42, "text": "foo"})
+        with fix.session.begin_transaction() as t:
+            rows = t.session.execute(text("SELECT id FROM test")).all()
+        assert rows == [(42,)]
+        assert fix.session is fix.session
+
+    def test_pragmas(self, fix: ExampleFixture) -> None:
+        assert fix.select_sql_one_row("PRAGMA foreign_keys") == (1,)
+        assert fix.select_sql_one_row("PRAGMA synchronous") == (0,)
+
+    def test_share_database_between_threads(self, fix: ExampleFixture) -> None:
+        fix.execute_sql("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+        fix.insert("test", {"id": 42, "text": "foo"})
+        rows: list[Any] = []
+
+        def select() -> None:
+            assert fix.engine is not None
+            with fix.engine.connect() as conn:
+                rows.extend(conn.execute(text("SELECT id FROM test")))
+
+        thread = Thread(target=select)
+        thread.start()
+        thread.join()
+        assert rows == [(42,)]
+
+
+def test_close_database() -> None:
+    with ExampleFixture() as fixture:
+        connection = fixture.connection.connection.driver_connection
+    assert isinstance(connection, sqlite3.Connection)
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
+
+
+class TestSQLPathFixture:
+    def test_copy_built_database(self, tmp_path: Path) -> None:
+        (tmp_path / "items.sql").write_text(
+            "CREATE TABLE items (id INTEGER);\nINSERT INTO items VALUES (1);\n"
+        )
+
+        class ScriptFixture(DBFixture):
+            sql_path = tmp_path
+            requirements = ["items"]
+            cache_database = True
+
+        with ScriptFixture() as fixture:
+            fixture.execute_sql("INSERT INTO items VALUES (2)")
+            fixture.assert_row_count("items", 2)
+        with ScriptFixture() as fixture:
+            fixture.assert_only_row_equals("items", {"id": 1})
+            fixture.require("items")
+            fixture.assert_row_count("items", 1)
+
+    def test_rebuild_modified_script(self, tmp_path: Path) -> None:
+        (tmp_path / "items.sql").write_text(
+            "CREATE TABLE items (id INTEGER);\n"
+        )
+
+        class ScriptFixture(DBFixture):
+            sql_path = tmp_path
+            requirements = ["items"]
+            cache_database = True
+
+        with ScriptFixture() as fixture:
+            fixture.assert_table_is_empty("items")
+        (tmp_path / "items.sql").write_text(
+            "CREATE TABLE items (id INTEGER);\nINSERT INTO items VALUES (1);\n"
+        )
+        with ScriptFixture() as fixture:
+            fixture.assert_only_row_equals("items", {"id": 1})
+
+    def test_require_override(self, tmp_path: Path) -> None:
+        (tmp_path / "items.sql").write_text(
+            "CREATE TABLE items (id INTEGER);\n"
+        )
+        calls: list[tuple[str, ...]] = []
+
+        class ScriptFixture(DBFixture):
+            sql_path = tmp_path
+            requirements = ["items"]
+            cache_database = True
+
+            def require(self, *features: str) -> None:
+                calls.append(features)
+                super().require(*features)
+
+        with ScriptFixture():
+            pass
+        with ScriptFixture() as fixture:
+            fixture.assert_table_is_empty("items")
+        assert calls == [("items",), ("items",)]
+
+    def test_temp_objects_without_cache(self, tmp_path: Path) -> None:
+        (tmp_path / "items.sql").write_text(
+            "CREATE TABLE items (id INTEGER);\n"
+            "CREATE TEMP VIEW v_items AS SELECT * FROM items;\n"
+            "PRAGMA recursive_triggers=ON;\n"
+        )
+
+        class ScriptFixture(DBFixture):
+            sql_path = tmp_path
+            requirements = ["items"]
+
+        for _ in range(2):
+            with ScriptFixture() as fixture:
+                assert fixture.select_sql("SELECT * FROM v_items") == []
+                assert fixture.select_sql_one_row(
+                    "PRAGMA recursive_triggers"
+                ) == (1,)
+
+    def test_fast_script(self, tmp_path: Path) -> None:
+        (tmp_path / "notes.sql").write_text(
+            "CREATE TABLE notes (id INTEGER, text VARCHAR(10));\n"
+            "INSERT INTO notes VALUES (1, '12:30');\n"
+        )
+
+        class ScriptFixture(DBFixture):
+            sql_path = tmp_path
+            fast_script = True
+
+        with ScriptFixture() as fixture:
+            fixture.require("notes")
+            fixture.assert_only_row_equals("notes", {"id": 1, "text": "12:30"})
+
+    def test_reflect_tables(self, tmp_path: Path) -> None:
+        (tmp_path / "tags.sql").write_text(
+            "CREATE TABLE tags (id INTEGER);\n"
+            "CREATE TABLE item_tags (tag_id INTEGER);\n"
+        )
+
+        class ScriptFixture(DBFixture):
+            sql_path = tmp_path
+            requirements = ["tags"]
+            tables = ["tags", "item_tags"]
+
+        with ScriptFixture() as fixture:
+            fixture.insert("tags", {"id": 1})
+            fixture.assert_row_count("tags", 1)
+            fixture.assert_table_is_empty("item_tags")
+
+
+class TestDBPathFixture:
+    def test_copy_template(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "template.sqlite"
+        with closing(sqlite3.connect(db_path)) as conn:
+            conn.execute("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+            conn.execute("INSERT INTO test VALUES (42, 'foo')")
+            conn.commit()
+
+        class TemplateFixture(DBFixture):
+            pass
+
+        TemplateFixture.db_path = db_path
+        with TemplateFixture() as fixture:
+            fixture.assert_only_row_equals("test", {"id": 42, "text": "foo"})
+            fixture.execute_sql("DELETE FROM test")
+        with TemplateFixture() as fixture:
+            fixture.assert_row_count("test", 1)
+
+    def test_str_path(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "template.sqlite"
+        with closing(sqlite3.connect(db_path)) as conn:
+            conn.execute("CREATE TABLE test (id INTEGER, text VARCHAR(10))")
+            conn.commit()
+
+        class TemplateFixture(DBFixture):
+            pass
+
+        TemplateFixture.db_path = str(db_path)  # type: ignore[assignment]
+        with TemplateFixture() as fixture:
+            fixture.assert_table_is_empty("test")
+
+
+def test_assert_one_row_equals(fix: ExampleFixture) -> None:
+    rows = fix.select_sql(
+        "SELECT 1 AS id, 'foo' AS text UNION SELECT 2, 'bar'"
+    )
+    assert_one_row_equals(rows, {"id": 2, "text": "bar"})
+    with pytest.raises(pytest.fail.Exception):
+        assert_one_row_equals(rows, {"id": 2, "text": "foo"})
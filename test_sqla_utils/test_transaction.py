@@ -3,11 +3,22 @@ from __future__ import annotations
 from collections.abc import Generator
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session
+from sqlalchemy import Column, Integer, String, create_engine, text
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.orm.exc import UnmappedInstanceError
 
 from sqla_utils.transaction import Transaction
 
+_Base = declarative_base()
+
+
+class DBNote(_Base):  # type: ignore
+    __tablename__ = "notes"
+
+    id = Column(Integer, primary_key=True)
+    text = Column(String(20), nullable=False)
+
 
 @pytest.fixture
 def sa_session() -> Generator[Session, None, None]:
@@ -16,6 +27,14 @@ def sa_session() -> Generator[Session, None, None]:
         yield session
 
 
+@pytest.fixture
+def t(sa_session: Session) -> Generator[Transaction, None, None]:
+    _Base.metadata.create_all(sa_session.get_bind())
+    with Transaction(sa_session) as t:
+        t.add(DBNote(id=1, text="one"), DBNote(id=2, text="two"))
+        yield t
+
+
 def test_execute_textual_sql(sa_session: Session) -> None:
     with Transaction(sa_session) as t:
         result = t.execute("SELECT 1")
@@ -28,3 +47,76 @@ def test_scalar_textual_sql(sa_session: Session) -> None:
     with Transaction(sa_session) as t:
         result = t.scalar("SELECT 1")
         assert result == 1
+
+
+def test_textual_sql_with_args(sa_session: Session) -> None:
+    with Transaction(sa_session) as t:
+        assert t.scalar("SELECT :arg", {"arg": 1}) == 1
+        assert t.scalar("SELECT :arg", {"arg": 2}) == 2
+        assert t.execute("SELECT :arg", {"arg": 3}).all() == [(3,)]
+
+
+def test_commit(sa_session: Session) -> None:
+    sa_session.execute(text("CREATE TABLE test (id INTEGER)"))
+    with Transaction(sa_session) as t:
+        t.execute("INSERT INTO test VALUES (1)")
+    assert sa_session.execute(text("SELECT id FROM test")).all() == [(1,)]
+
+
+def test_rollback(sa_session: Session) -> None:
+    sa_session.execute(text("CREATE TABLE test (id INTEGER)"))
+    sa_session.commit()
+    with pytest.raises(ValueError):
+        with Transaction(sa_session) as t:
+            t.execute("INSERT INTO test VALUES (1)")
+            raise ValueError()
+    assert sa_session.execute(text("SELECT id FROM test")).all() == []
+
+
+def test_add_without_flush(t: Transaction) -> None:
+    note = DBNote(id=3, text="three")
+    t.add(note, flush=False)
+    assert note in t.session.new
+    t.flush()
+    assert t.scalar("SELECT text FROM notes WHERE id = 3") == "three"
+
+
+def test_delete_without_flush(t: Transaction) -> None:
+    note = t.query(DBNote).filter(DBNote.id == 1).one()
+    t.delete(note, flush=False)
+    assert note in t.session.deleted
+    t.flush()
+    assert t.scalar("SELECT COUNT(*) FROM notes") == 1
+
+
+def _fetch_notes(t: Transaction) -> list[DBNote]:
+    return t.query(DBNote).order_by(DBNote.id).all()
+
+
+def test_refresh(t: Transaction) -> None:
+    one, two = _fetch_notes(t)
+    t.execute("UPDATE notes SET text = text || '!'")
+    t.refresh(one, two)
+    assert (one.text, two.text) == ("one!", "two!")
+
+
+def test_refresh_discards_changes(t: Transaction) -> None:
+    one, two = _fetch_notes(t)
+    one.text = "changed"  # type: ignore[assignment]
+    two.text = "changed2"  # type: ignore[assignment]
+    t.refresh(one, two)
+    assert (one.text, two.text) == ("one", "two")
+    rows = t.execute("SELECT text FROM notes ORDER BY id").all()
+    assert rows == [("one",), ("two",)]
+
+
+def test_refresh_deleted(t: Transaction) -> None:
+    one, two = _fetch_notes(t)
+    t.execute("DELETE FROM notes WHERE id = 2")
+    with pytest.raises(InvalidRequestError):
+        t.refresh(one, two)
+
+
+def test_refresh_unmapped(t: Transaction) -> None:
+    with pytest.raises(UnmappedInstanceError):
+        t.refresh(object())